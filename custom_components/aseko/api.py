@@ -3,20 +3,88 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import lru_cache, wraps
 import logging
+import math
+import time
 from typing import Any
 
-from aiohttp import ClientSession, ClientResponseError
+from aiohttp import ClientError, ClientResponseError, ClientSession
 
-from .const import API_BASE_URL, CLIENT_NAME, CLIENT_VERSION
+try:
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    from json import loads as json_loads
+
+from .const import (
+    API_BASE_URL,
+    AUTH_CHECK_CACHE_TTL,
+    CLIENT_NAME,
+    CLIENT_VERSION,
+    DEFAULT_HTTP_TIMEOUT,
+    MAX_CONCURRENT_UNIT_FETCHES,
+    UNIT_LIST_CACHE_TTL,
+    WARN_SEVERITIES,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Responses to the expand probe meaning the list cannot inline unit details
+_EXPAND_UNSUPPORTED_STATUSES = frozenset({400, 404, 422})
+
+# String status values that mean "on"
+_TRUTHY = frozenset({"YES", "ON", "TRUE", "1"})
+
+# Status values parsed into booleans once per unit, at parse time
+BOOL_KEYS = (
+    "waterFlowToProbes",
+    "heatingRunning",
+    "electrolyzerRunning",
+    "solarRunning",
+    "filtrationRunning",
+    "waterFillingRunning",
+)
+
+# Numeric status values parsed once per unit, at parse time
+FLOAT_KEYS = (
+    "waterTemperature",
+    "airTemperature",
+    "ph",
+    "clFree",
+    "salinity",
+    "clFreeRequired",
+    "clBounded",
+    "electrodePower",
+    "filterFlowSpeed",
+    "filterPressure",
+    "phRequired",
+    "solarTemperature",
+    "waterLevel",
+    "waterTemperatureRequired",
+)
+INT_KEYS = (
+    "redox",
+    "electrolyzer",
+    "dose",
+    "redoxRequired",
+)
+
 
 class AsekoApiError(Exception):
     """Base exception for Aseko API errors."""
 
+    def __init__(self, message: str, status: int | None = None) -> None:
+        """Initialize the error.
+
+        Args:
+            message: Error message
+            status: HTTP status of the failed response, if there was one
+        """
+        super().__init__(message)
+        self.status = status
+
 
 class AsekoAuthError(AsekoApiError):
     """Exception for authentication errors."""
@@ -30,7 +98,7 @@ class AsekoNotFoundError(AsekoApiError):
     """Exception for resource not found (404)."""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AsekoUnit:
     """Representation of an Aseko unit."""
 
@@ -42,6 +110,75 @@ class AsekoUnit:
     brand_name: str | None
     status_values: dict[str, Any]
     status_messages: list[dict[str, Any]]
+    parsed_bools: dict[str, bool | None] = field(default_factory=dict)
+
+
+def _memoize_strings(
+    parser: Callable[[Any], Any],
+) -> Callable[[Any], Any]:
+    """Memoize a parser for str values, parsing anything else directly.
+
+    Readings repeat across polls, so string results are worth caching, while
+    unexpected types (possibly unhashable) must not reach the cache.
+    """
+    cached = lru_cache(maxsize=256)(parser)
+
+    @wraps(parser)
+    def wrapper(value: Any) -> Any:
+        if isinstance(value, str):
+            return cached(value)
+        return parser(value)
+
+    return wrapper
+
+
+@_memoize_strings
+def _parse_float(value: str | float | None) -> float | None:
+    """Parse a float value, returning None for invalid values."""
+    if value is None or value == "" or value == "---":
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+@_memoize_strings
+def _parse_int(value: str | float | None) -> int | None:
+    """Parse an int value, returning None for invalid values."""
+    if value is None or value == "" or value == "---":
+        return None
+    try:
+        # Integer-shaped strings (the common case) skip the float round-trip
+        return int(value)
+    except (ValueError, TypeError):
+        pass
+    number = _parse_float(value)
+    if number is None:
+        return None
+    try:
+        return int(number)
+    except (ValueError, OverflowError):
+        # nan or inf
+        return None
+
+
+# Parser for each numeric status value, looked up once per value
+_VALUE_PARSERS: dict[str, Callable[[Any], Any]] = {
+    **dict.fromkeys(FLOAT_KEYS, _parse_float),
+    **dict.fromkeys(INT_KEYS, _parse_int),
+}
+
+
+def _parse_bool_status(value: Any) -> bool | None:
+    """Parse a boolean status value."""
+    if value is None or value == "---":
+        return None
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        return value.upper() in _TRUTHY
+    return bool(value)
 
 
 class AsekoApiClient:
@@ -56,27 +193,65 @@ class AsekoApiClient:
         """
         self._session = session
         self._api_key = api_key
-
-    def _headers(self) -> dict[str, str]:
-        """Return headers required for API requests."""
-        return {
-            "Authorization": f"Bearer {self._api_key}",
+        # Headers required for API requests, fixed for the client's lifetime
+        self._cached_headers: dict[str, str] = {
+            "Authorization": f"Bearer {api_key}",
             "X-Client-Name": CLIENT_NAME,
             "X-Client-Version": CLIENT_VERSION,
             "Accept": "application/json",
         }
+        self._sem = asyncio.Semaphore(MAX_CONCURRENT_UNIT_FETCHES)
+        # Short-lived response cache: key -> (expires_at, data)
+        self._cache: dict[tuple[Any, ...], tuple[float, dict[str, Any]]] = {}
+        # Cache lifetime per endpoint; endpoints not listed are never cached
+        # (unit details must always be fresh)
+        self._ttls: dict[str, float] = {
+            "/auth/check": AUTH_CHECK_CACHE_TTL,
+            "/paired-units": UNIT_LIST_CACHE_TTL,
+        }
+        # Conditional GET validators: key -> (etag, last_modified, data)
+        self._validators: dict[
+            tuple[Any, ...], tuple[str | None, str | None, dict[str, Any]]
+        ] = {}
+        # Raw list items of the last serial number listing, by serial number
+        self._list_items: dict[str, dict[str, Any]] = {}
+        # Details of units the list reported offline when they were fetched
+        self._offline_units: dict[str, AsekoUnit] = {}
+        # Whether the list endpoint can inline unit details (None = not probed)
+        self._supports_bulk_expand: bool | None = None
+        # GET requests currently in flight, shared by concurrent callers
+        self._inflight: dict[tuple[Any, ...], asyncio.Future[dict[str, Any]]] = {}
+        # Number of callers awaiting each in-flight request
+        self._inflight_waiters: dict[asyncio.Future[dict[str, Any]], int] = {}
+
+    @staticmethod
+    def _cache_key(
+        method: str, endpoint: str, params: dict[str, Any] | None
+    ) -> tuple[Any, ...]:
+        """Return a hashable key identifying a request."""
+        return (method, endpoint, frozenset((params or {}).items()))
 
     async def _request(
         self,
         method: str,
         endpoint: str,
+        *,
+        force_refresh: bool = False,
         **kwargs: Any,
     ) -> dict[str, Any]:
         """Make an authenticated API request.
 
+        GET responses for endpoints listed in ``_ttls`` are cached in memory
+        for their configured lifetime. GET requests also send the ETag and
+        Last-Modified validators of the previous response, so an unchanged
+        resource is answered with 304 and the previous body is reused.
+        Concurrent identical GET requests share a single in-flight request,
+        which is cancelled once every caller awaiting it has been cancelled.
+
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint path (e.g., "/auth/check")
+            force_refresh: Bypass the response cache and hit the API
             **kwargs: Additional arguments passed to session.request
 
         Returns:
@@ -85,27 +260,118 @@ class AsekoApiClient:
         Raises:
             AsekoAuthError: If API key is invalid (401/403)
             AsekoNotFoundError: If resource not found (404)
-            AsekoConnectionError: For connection errors
+            AsekoConnectionError: For connection errors and timeouts
             AsekoApiError: For other API errors
         """
+        ttl = self._ttls.get(endpoint, 0) if method == "GET" else 0
+        cache_key = self._cache_key(method, endpoint, kwargs.get("params"))
+
+        if ttl and not force_refresh:
+            cached = self._cache.get(cache_key)
+            if cached is not None and time.monotonic() < cached[0]:
+                return cached[1]
+
+        if method != "GET":
+            return await self._send_request(
+                method, endpoint, cache_key, ttl, **kwargs
+            )
+
+        if (inflight := self._inflight.get(cache_key)) is None:
+            inflight = asyncio.ensure_future(
+                self._send_request(method, endpoint, cache_key, ttl, **kwargs)
+            )
+            self._inflight[cache_key] = inflight
+            inflight.add_done_callback(
+                lambda _: self._inflight.pop(cache_key, None)
+            )
+
+        waiters = self._inflight_waiters.get(inflight, 0)
+        self._inflight_waiters[inflight] = waiters + 1
+        try:
+            # Shield so a cancelled caller does not cancel the request for others
+            return await asyncio.shield(inflight)
+        finally:
+            if waiters := self._inflight_waiters.pop(inflight) - 1:
+                self._inflight_waiters[inflight] = waiters
+            elif not inflight.done():
+                # The last caller was cancelled, so nobody needs the response
+                inflight.cancel()
+
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        cache_key: tuple[Any, ...],
+        ttl: float,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Send a request to the API and store the response for reuse.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            cache_key: Key identifying the request (see _cache_key)
+            ttl: Response cache lifetime in seconds (0 to skip caching)
+            **kwargs: Additional arguments passed to session.request
+
+        Returns:
+            JSON response as dictionary
+
+        Raises:
+            AsekoApiError: See _request
+        """
         url = f"{API_BASE_URL}{endpoint}"
+        headers = self._cached_headers
+        validators = self._validators.get(cache_key) if method == "GET" else None
+        if validators is not None:
+            etag, last_modified, _ = validators
+            headers = dict(headers)
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
 
         try:
-            async with self._session.request(
-                method, url, headers=self._headers(), **kwargs
-            ) as response:
-                if response.status in (401, 403):
-                    raise AsekoAuthError("Invalid or expired API key")
-                if response.status == 404:
-                    raise AsekoNotFoundError(f"Resource not found: {endpoint}")
-                response.raise_for_status()
-                return await response.json()
+            async with asyncio.timeout(DEFAULT_HTTP_TIMEOUT):
+                async with self._session.request(
+                    method, url, headers=headers, **kwargs
+                ) as response:
+                    if response.status in (401, 403):
+                        raise AsekoAuthError("Invalid or expired API key")
+                    if response.status == 404:
+                        raise AsekoNotFoundError(
+                            f"Resource not found: {endpoint}", status=404
+                        )
+                    if response.status == 304 and validators is not None:
+                        data = validators[2]
+                    else:
+                        response.raise_for_status()
+                        data = json_loads(await response.read())
+                        if method == "GET":
+                            etag = response.headers.get("ETag")
+                            last_modified = response.headers.get("Last-Modified")
+                            if etag or last_modified:
+                                self._validators[cache_key] = (
+                                    etag,
+                                    last_modified,
+                                    data,
+                                )
         except ClientResponseError as err:
-            raise AsekoApiError(f"API request failed: {err.status}") from err
-        except AsekoApiError:
-            raise
-        except Exception as err:
+            raise AsekoApiError(
+                f"API request failed: {err.status}", status=err.status
+            ) from err
+        except asyncio.TimeoutError as err:
+            raise AsekoConnectionError(
+                f"Request timed out after {DEFAULT_HTTP_TIMEOUT}s: {endpoint}"
+            ) from err
+        except (ClientError, OSError) as err:
             raise AsekoConnectionError(f"Connection error: {err}") from err
+        except ValueError as err:
+            raise AsekoApiError(f"Invalid JSON response: {endpoint}") from err
+
+        if ttl:
+            self._cache[cache_key] = (time.monotonic() + ttl, data)
+        return data
 
     async def validate_api_key(self) -> bool:
         """Validate the API key.
@@ -120,47 +386,127 @@ class AsekoApiClient:
         data = await self._request("GET", "/auth/check")
         return data.get("valid", False)
 
-    async def get_unit_serials(self) -> list[str]:
+    async def _get_paired_unit_items(
+        self,
+        extra_params: dict[str, Any] | None = None,
+        *,
+        force_refresh: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Get all items of the paginated paired units list.
+
+        Args:
+            extra_params: Additional query parameters sent with every page
+            force_refresh: Bypass the response cache
+
+        Returns:
+            List of raw unit items across all pages
+
+        Raises:
+            AsekoApiError: For API errors
+        """
+        limit = 100
+        params = {"limit": limit, **(extra_params or {})}
+
+        # The first page tells us the total, the remaining pages are
+        # then fetched in parallel
+        data = await self._request(
+            "GET",
+            "/paired-units",
+            params={"page": 1, **params},
+            force_refresh=force_refresh,
+        )
+        all_items: list[dict[str, Any]] = list(data.get("items", []))
+        if not all_items:
+            return all_items
+
+        total_items = data.get("totalItems", 0)
+        remaining_pages = range(2, math.ceil(total_items / limit) + 1)
+        results = await asyncio.gather(
+            *[
+                self._request(
+                    "GET",
+                    "/paired-units",
+                    params={"page": page, **params},
+                    force_refresh=force_refresh,
+                )
+                for page in remaining_pages
+            ]
+        )
+        extend = all_items.extend
+        for result in results:
+            extend(result.get("items", []))
+
+        return all_items
+
+    async def get_unit_serials(self) -> tuple[str, ...]:
         """Get all paired unit serial numbers without fetching details.
 
         This is a lightweight call for validation/setup purposes.
-        Returns serial numbers sorted for stable ordering.
+        Returns serial numbers sorted for stable ordering. The list response
+        itself is cached by _request for UNIT_LIST_CACHE_TTL seconds.
 
         Returns:
-            List of serial numbers (sorted)
+            Tuple of serial numbers (sorted)
 
         Raises:
             AsekoApiError: For API errors
         """
-        all_serial_numbers: list[str] = []
-        page = 1
-        limit = 100
+        items = await self._get_paired_unit_items()
+        self._list_items = {item["serialNumber"]: item for item in items}
 
-        while True:
-            data = await self._request(
-                "GET",
-                "/paired-units",
-                params={"page": page, "limit": limit},
-            )
+        # Sort in place for stable ordering across API responses
+        all_serial_numbers = [item["serialNumber"] for item in items]
+        all_serial_numbers.sort()
+        return tuple(all_serial_numbers)
+
+    async def _get_units_expanded(self) -> list[AsekoUnit] | None:
+        """Get all units with details inlined in the paired units list.
+
+        Returns:
+            List of AsekoUnit objects, or None if the API does not support
+            expanding unit details in the list response
 
-            items = data.get("items", [])
-            if not items:
-                break
+        Raises:
+            AsekoAuthError: If authentication fails
+        """
+        try:
+            # Unit details must always be fresh, so skip the list cache
+            items = await self._get_paired_unit_items(
+                {"expand": "full"}, force_refresh=True
+            )
+        except AsekoAuthError:
+            raise
+        except AsekoApiError as err:
+            if err.status in _EXPAND_UNSUPPORTED_STATUSES:
+                _LOGGER.debug("Expanded unit list not supported: %s", err)
+                self._supports_bulk_expand = False
+            else:
+                # Transient (connection, 5xx, 429, bad body), so probe
+                # again on the next refresh
+                _LOGGER.debug("Expanded unit list request failed: %s", err)
+            return None
 
-            all_serial_numbers.extend(item["serialNumber"] for item in items)
+        if not items:
+            return []
 
-            total_items = data.get("totalItems", 0)
-            if page * limit >= total_items:
-                break
-            page += 1
+        if not all(
+            "statusValues" in item and "statusMessages" in item for item in items
+        ):
+            # The API ignored the expand parameter
+            self._supports_bulk_expand = False
+            return None
 
-        # Sort for stable ordering across API responses
-        return sorted(all_serial_numbers)
+        self._supports_bulk_expand = True
+        return [self._parse_unit(item) for item in items]
 
     async def get_units(self) -> list[AsekoUnit]:
         """Get all paired units with full details.
 
-        Automatically handles pagination and fetches unit details in parallel.
+        Prefers a single paginated list call with details inlined. If the API
+        does not support that, fetches unit details in parallel, with at most
+        MAX_CONCURRENT_UNIT_FETCHES requests in flight at once. Units the list
+        reports as offline are fetched once, then reused from that fetch
+        until they come back online.
 
         Returns:
             List of AsekoUnit objects
@@ -169,22 +515,52 @@ class AsekoApiClient:
             AsekoAuthError: If authentication fails (fatal, bubbles up)
             AsekoApiError: For API errors or if fetching units fails
         """
+        if self._supports_bulk_expand is not False:
+            expanded_units = await self._get_units_expanded()
+            if expanded_units is not None:
+                return expanded_units
+
         all_serial_numbers = await self.get_unit_serials()
 
         if not all_serial_numbers:
             return []
 
-        # Fetch all unit details in parallel
+        # Offline units have no fresh status, so once their details (status
+        # values and the offline message) are known, skip the detail request
+        offline_serials = {
+            serial_number
+            for serial_number in all_serial_numbers
+            if (item := self._list_items.get(serial_number)) is not None
+            and item.get("online") is False
+        }
+        offline_units = {
+            serial_number: unit
+            for serial_number, unit in self._offline_units.items()
+            if serial_number in offline_serials
+        }
+        to_fetch = [sn for sn in all_serial_numbers if sn not in offline_units]
+
+        async def _fetch(serial_number: str) -> AsekoUnit:
+            async with self._sem:
+                return await self.get_unit(serial_number)
+
+        # Fetch all unit details in parallel (bounded by the semaphore)
         results = await asyncio.gather(
-            *[self.get_unit(sn) for sn in all_serial_numbers],
+            *[_fetch(sn) for sn in to_fetch],
             return_exceptions=True,
         )
+        fetched = dict(zip(to_fetch, results))
 
         units: list[AsekoUnit] = []
         errors: list[tuple[str, Exception]] = []
         not_found_count = 0
 
-        for serial_number, result in zip(all_serial_numbers, results):
+        for serial_number in all_serial_numbers:
+            if serial_number in offline_units:
+                units.append(offline_units[serial_number])
+                continue
+
+            result = fetched[serial_number]
             if isinstance(result, AsekoAuthError):
                 # Auth errors are fatal - bubble up immediately
                 raise result
@@ -197,8 +573,12 @@ class AsekoApiClient:
                 )
                 errors.append((serial_number, result))
             else:
+                if serial_number in offline_serials:
+                    offline_units[serial_number] = result
                 units.append(result)
 
+        self._offline_units = offline_units
+
         # If we had serials but got no units at all, something is wrong
         if not units and all_serial_numbers:
             if not_found_count == len(all_serial_numbers):
@@ -246,10 +626,20 @@ class AsekoApiClient:
         # Derive has_warning from statusMessages (API doesn't have hasWarning field)
         status_messages = data.get("statusMessages", [])
         has_warning = any(
-            msg.get("severity") in ("ERROR", "WARNING")
-            for msg in status_messages
+            msg.get("severity") in WARN_SEVERITIES for msg in status_messages
         )
 
+        # Numeric values are parsed once here, everything else kept as reported
+        status_values = {
+            key: parser(value) if (parser := _VALUE_PARSERS.get(key)) else value
+            for key, value in data.get("statusValues", {}).items()
+        }
+        parsed_bools = {
+            key: _parse_bool_status(status_values[key])
+            for key in BOOL_KEYS
+            if key in status_values
+        }
+
         return AsekoUnit(
             serial_number=data["serialNumber"],
             name=data.get("name"),
@@ -257,7 +647,8 @@ class AsekoApiClient:
             online=data.get("online", False),
             has_warning=has_warning,
             brand_name=brand_name,
-            status_values=data.get("statusValues", {}),
+            status_values=status_values,
             status_messages=status_messages,
+            parsed_bools=parsed_bools,
         )
 
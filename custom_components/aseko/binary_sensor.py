@@ -18,7 +18,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .api import AsekoUnit
-from .const import DOMAIN, STATUS_MESSAGE_TRANSLATIONS
+from .const import DOMAIN, STATUS_MESSAGE_TRANSLATIONS, WARN_SEVERITIES
 from .coordinator import AsekoDataUpdateCoordinator
 
 
@@ -30,18 +30,6 @@ class AsekoBinarySensorEntityDescription(BinarySensorEntityDescription):
     available_fn: Callable[[AsekoUnit], bool] = lambda _: True
 
 
-def _parse_bool_status(unit: AsekoUnit, key: str) -> bool | None:
-    """Parse a boolean status value."""
-    value = unit.status_values.get(key)
-    if value is None or value == "---":
-        return None
-    if isinstance(value, bool):
-        return value
-    if isinstance(value, str):
-        return value.upper() in ("YES", "ON", "TRUE", "1")
-    return bool(value)
-
-
 BINARY_SENSOR_DESCRIPTIONS: tuple[AsekoBinarySensorEntityDescription, ...] = (
     AsekoBinarySensorEntityDescription(
         key="online",
@@ -59,43 +47,43 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[AsekoBinarySensorEntityDescription, ...] = (
         key="water_flow_to_probes",
         translation_key="water_flow_to_probes",
         device_class=BinarySensorDeviceClass.RUNNING,
-        value_fn=lambda unit: _parse_bool_status(unit, "waterFlowToProbes"),
-        available_fn=lambda unit: "waterFlowToProbes" in unit.status_values,
+        value_fn=lambda unit: unit.parsed_bools.get("waterFlowToProbes"),
+        available_fn=lambda unit: "waterFlowToProbes" in unit.parsed_bools,
     ),
     AsekoBinarySensorEntityDescription(
         key="heating",
         translation_key="heating",
         device_class=BinarySensorDeviceClass.HEAT,
-        value_fn=lambda unit: _parse_bool_status(unit, "heatingRunning"),
-        available_fn=lambda unit: "heatingRunning" in unit.status_values,
+        value_fn=lambda unit: unit.parsed_bools.get("heatingRunning"),
+        available_fn=lambda unit: "heatingRunning" in unit.parsed_bools,
     ),
     AsekoBinarySensorEntityDescription(
         key="electrolyzer_running",
         translation_key="electrolyzer_running",
         device_class=BinarySensorDeviceClass.RUNNING,
-        value_fn=lambda unit: _parse_bool_status(unit, "electrolyzerRunning"),
-        available_fn=lambda unit: "electrolyzerRunning" in unit.status_values,
+        value_fn=lambda unit: unit.parsed_bools.get("electrolyzerRunning"),
+        available_fn=lambda unit: "electrolyzerRunning" in unit.parsed_bools,
     ),
     AsekoBinarySensorEntityDescription(
         key="solar_running",
         translation_key="solar_running",
         device_class=BinarySensorDeviceClass.RUNNING,
-        value_fn=lambda unit: _parse_bool_status(unit, "solarRunning"),
-        available_fn=lambda unit: "solarRunning" in unit.status_values,
+        value_fn=lambda unit: unit.parsed_bools.get("solarRunning"),
+        available_fn=lambda unit: "solarRunning" in unit.parsed_bools,
     ),
     AsekoBinarySensorEntityDescription(
         key="filtration_running",
         translation_key="filtration_running",
         device_class=BinarySensorDeviceClass.RUNNING,
-        value_fn=lambda unit: _parse_bool_status(unit, "filtrationRunning"),
-        available_fn=lambda unit: "filtrationRunning" in unit.status_values,
+        value_fn=lambda unit: unit.parsed_bools.get("filtrationRunning"),
+        available_fn=lambda unit: "filtrationRunning" in unit.parsed_bools,
     ),
     AsekoBinarySensorEntityDescription(
         key="water_filling_running",
         translation_key="water_filling_running",
         device_class=BinarySensorDeviceClass.RUNNING,
-        value_fn=lambda unit: _parse_bool_status(unit, "waterFillingRunning"),
-        available_fn=lambda unit: "waterFillingRunning" in unit.status_values,
+        value_fn=lambda unit: unit.parsed_bools.get("waterFillingRunning"),
+        available_fn=lambda unit: "waterFillingRunning" in unit.parsed_bools,
     ),
 )
 
@@ -108,14 +96,43 @@ async def async_setup_entry(
     """Set up Aseko binary sensors based on a config entry."""
     coordinator: AsekoDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    # Track which units we've already created entities for
-    known_units: set[str] = set()
+    add_new_entities = _AsekoEntityAdder(coordinator, async_add_entities)
+
+    # Add entities for initial data
+    add_new_entities()
+
+    # Register listener for future updates to discover new units
+    entry.async_on_unload(coordinator.async_add_listener(add_new_entities))
+
+
+class _AsekoEntityAdder:
+    """Add binary sensor entities for newly discovered units."""
+
+    __slots__ = ("coordinator", "async_add_entities", "known_units")
+
+    def __init__(
+        self,
+        coordinator: AsekoDataUpdateCoordinator,
+        async_add_entities: AddEntitiesCallback,
+    ) -> None:
+        """Initialize the entity adder."""
+        self.coordinator = coordinator
+        self.async_add_entities = async_add_entities
+        # Track which units we've already created entities for
+        # (insertion-ordered dict used as a set)
+        self.known_units: dict[str, None] = {}
 
     @callback
-    def _async_add_new_entities() -> None:
+    def __call__(self) -> None:
         """Add entities for newly discovered units."""
+        coordinator = self.coordinator
+        known_units = self.known_units
+        if not coordinator.data.keys() - known_units:
+            return
+
         new_entities: list[AsekoBinarySensorEntity] = []
 
+        # Walk the coordinator data so entities are created in unit order
         for serial_number, unit in coordinator.data.items():
             if serial_number in known_units:
                 continue
@@ -126,18 +143,10 @@ async def async_setup_entry(
                         AsekoBinarySensorEntity(coordinator, unit, description)
                     )
 
-            known_units.add(serial_number)
+            known_units[serial_number] = None
 
         if new_entities:
-            async_add_entities(new_entities)
-
-    # Add entities for initial data
-    _async_add_new_entities()
-
-    # Register listener for future updates to discover new units
-    entry.async_on_unload(
-        coordinator.async_add_listener(_async_add_new_entities)
-    )
+            self.async_add_entities(new_entities)
 
 
 class AsekoBinarySensorEntity(
@@ -165,53 +174,59 @@ class AsekoBinarySensorEntity(
             manufacturer="Aseko",
             model=unit.brand_name,
         )
+        self._unit_available = False
+        self._update_from_unit(unit)
+
+    def _update_from_unit(self, unit: AsekoUnit | None) -> None:
+        """Derive this sensor's state from the unit's latest data."""
+        description = self.entity_description
+        if unit is None:
+            self._attr_is_on = None
+            self._unit_available = False
+        else:
+            self._attr_is_on = description.value_fn(unit)
+            self._unit_available = description.available_fn(unit)
+        if description.key == "has_warning":
+            self._attr_extra_state_attributes = self._build_warning_attributes(unit)
 
-    @property
-    def _unit(self) -> AsekoUnit | None:
-        """Return the unit data."""
-        return self.coordinator.data.get(self._serial_number)
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if the binary sensor is on."""
-        if not self._unit:
-            return None
-        return self.entity_description.value_fn(self._unit)
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Derive state once per refresh, then write it."""
+        data = self.coordinator.data
+        self._update_from_unit(data.get(self._serial_number) if data else None)
+        super()._handle_coordinator_update()
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        if not super().available or self._unit is None:
-            return False
-        return self.entity_description.available_fn(self._unit)
+        return super().available and self._unit_available
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return extra state attributes for the warning sensor."""
-        if self.entity_description.key != "has_warning":
-            return None
-        if not self._unit or not self._unit.status_messages:
+    @staticmethod
+    def _build_warning_attributes(unit: AsekoUnit | None) -> dict[str, Any] | None:
+        """Build the warning attributes from the unit's status messages."""
+        if not unit or not unit.status_messages:
             return None
 
         error_msgs = [
-            m for m in self._unit.status_messages
-            if m.get("severity") in ("ERROR", "WARNING")
+            m for m in unit.status_messages
+            if m.get("severity") in WARN_SEVERITIES
         ]
 
         if not error_msgs:
             return None
 
+        _tr = STATUS_MESSAGE_TRANSLATIONS.get
+        errors = [
+            {
+                "type": m.get("type"),
+                "severity": m.get("severity"),
+                "message": _tr(m.get("type", ""), m.get("message")),
+                "detail": m.get("detail"),
+            }
+            for m in error_msgs
+        ]
+
         return {
             "error_types": ",".join(m.get("type", "") for m in error_msgs),
-            "errors": [
-                {
-                    "type": m.get("type"),
-                    "severity": m.get("severity"),
-                    "message": STATUS_MESSAGE_TRANSLATIONS.get(
-                        m.get("type", ""), m.get("message")
-                    ),
-                    "detail": m.get("detail"),
-                }
-                for m in error_msgs
-            ],
+            "errors": errors,
         }
@@ -11,6 +11,25 @@ CLIENT_VERSION: Final = "1.0.0"
 CONF_API_KEY: Final = "api_key"
 
 DEFAULT_SCAN_INTERVAL: Final = 60  # seconds
+DEFAULT_HTTP_TIMEOUT: Final = 10  # seconds, per API request
+
+# Adaptive polling: back off towards MAX_SCAN_INTERVAL while nothing changes,
+# return to DEFAULT_SCAN_INTERVAL on any change or active warning. Readings
+# within READING_CHANGE_TOLERANCE (relative) of the last change count as
+# unchanged, so sensor jitter does not prevent backing off.
+MAX_SCAN_INTERVAL: Final = 300  # seconds
+UNCHANGED_CYCLES_BEFORE_BACKOFF: Final = 3
+READING_CHANGE_TOLERANCE: Final = 0.01
+
+# Upper bound on concurrent unit detail requests during a refresh
+MAX_CONCURRENT_UNIT_FETCHES: Final = 10
+
+# Response cache lifetimes for GET endpoints (seconds, 0 disables caching)
+AUTH_CHECK_CACHE_TTL: Final = 300
+UNIT_LIST_CACHE_TTL: Final = 30
+
+# Status message severities that count as a warning
+WARN_SEVERITIES: Final = frozenset({"ERROR", "WARNING"})
 
 # Translations for status message types from Aseko API
 # Used for extra_state_attributes on the warning binary sensor
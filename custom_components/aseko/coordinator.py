@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from datetime import timedelta
 import logging
+import math
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -11,7 +13,13 @@ from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import AsekoApiClient, AsekoUnit, AsekoApiError, AsekoAuthError
-from .const import DOMAIN, DEFAULT_SCAN_INTERVAL
+from .const import (
+    DOMAIN,
+    DEFAULT_SCAN_INTERVAL,
+    MAX_SCAN_INTERVAL,
+    READING_CHANGE_TOLERANCE,
+    UNCHANGED_CYCLES_BEFORE_BACKOFF,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -42,6 +50,66 @@ class AsekoDataUpdateCoordinator(DataUpdateCoordinator[dict[str, AsekoUnit]]):
             config_entry=entry,
         )
         self.client = client
+        # State of the previous refresh and how many refreshes it stayed the same
+        self._last_digest: tuple[Any, ...] | None = None
+        # Numeric readings as of the last refresh that counted as a change
+        self._baseline_readings: dict[tuple[str, str], float] = {}
+        self._unchanged_cycles = 0
+
+    def _readings_changed(self, units: list[AsekoUnit]) -> bool:
+        """Return True if a numeric reading moved beyond READING_CHANGE_TOLERANCE.
+
+        Readings are compared with those of the last change rather than the
+        previous refresh, so slow drift is still noticed.
+        """
+        readings = {
+            (unit.serial_number, key): value
+            for unit in units
+            for key, value in unit.status_values.items()
+            if isinstance(value, (int, float))
+        }
+        baseline = self._baseline_readings
+        changed = readings.keys() != baseline.keys() or any(
+            not math.isclose(value, baseline[key], rel_tol=READING_CHANGE_TOLERANCE)
+            for key, value in readings.items()
+        )
+        if changed:
+            self._baseline_readings = readings
+        return changed
+
+    def _adjust_update_interval(self, units: list[AsekoUnit]) -> None:
+        """Poll less often while nothing changes.
+
+        Connectivity, warnings and equipment state must match exactly, while
+        readings only count as changed beyond READING_CHANGE_TOLERANCE so
+        sensor jitter does not prevent backing off.
+        """
+        digest = tuple(
+            (
+                unit.serial_number,
+                unit.online,
+                unit.has_warning,
+                tuple(msg.get("type") for msg in unit.status_messages),
+                tuple(sorted(unit.parsed_bools.items())),
+            )
+            for unit in units
+        )
+        changed = self._readings_changed(units) or digest != self._last_digest
+        self._last_digest = digest
+
+        current = self.update_interval or timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+        if changed or any(unit.has_warning for unit in units):
+            self._unchanged_cycles = 0
+            new_interval = DEFAULT_SCAN_INTERVAL
+        else:
+            self._unchanged_cycles += 1
+            if self._unchanged_cycles < UNCHANGED_CYCLES_BEFORE_BACKOFF:
+                return
+            new_interval = min(current.total_seconds() * 2, MAX_SCAN_INTERVAL)
+
+        if new_interval != current.total_seconds():
+            _LOGGER.debug("Setting update interval to %s seconds", new_interval)
+            self.update_interval = timedelta(seconds=new_interval)
 
     async def _async_update_data(self) -> dict[str, AsekoUnit]:
         """Fetch data from Aseko API.
@@ -55,6 +123,7 @@ class AsekoDataUpdateCoordinator(DataUpdateCoordinator[dict[str, AsekoUnit]]):
         """
         try:
             units = await self.client.get_units()
+            self._adjust_update_interval(units)
             return {unit.serial_number: unit for unit in units}
         except AsekoAuthError as err:
             # Trigger reauth flow
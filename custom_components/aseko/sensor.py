@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Mapping
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -36,27 +37,6 @@ class AsekoSensorEntityDescription(SensorEntityDescription):
     """Describes an Aseko sensor entity."""
 
     status_key: str
-    value_fn: Callable[[str], Any] | None = None
-
-
-def _parse_float(value: str) -> float | None:
-    """Parse a float value, returning None for invalid values."""
-    if value in ("---", "", None):
-        return None
-    try:
-        return float(value)
-    except (ValueError, TypeError):
-        return None
-
-
-def _parse_int(value: str) -> int | None:
-    """Parse an int value, returning None for invalid values."""
-    if value in ("---", "", None):
-        return None
-    try:
-        return int(float(value))
-    except (ValueError, TypeError):
-        return None
 
 
 SENSOR_DESCRIPTIONS: tuple[AsekoSensorEntityDescription, ...] = (
@@ -67,7 +47,6 @@ SENSOR_DESCRIPTIONS: tuple[AsekoSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=_parse_float,
     ),
     AsekoSensorEntityDescription(
         key="air_temperature",
@@ -76,7 +55,6 @@ SENSOR_DESCRIPTIONS: tuple[AsekoSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=_parse_float,
     ),
     AsekoSensorEntityDescription(
         key="ph",
@@ -84,7 +62,6 @@ SENSOR_DESCRIPTIONS: tuple[AsekoSensorEntityDescription, ...] = (
         status_key="ph",
         device_class=SensorDeviceClass.PH,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=_parse_float,
     ),
     AsekoSensorEntityDescription(
         key="redox",
@@ -93,7 +70,6 @@ SENSOR_DESCRIPTIONS: tuple[AsekoSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.VOLTAGE,
         native_unit_of_measurement=UnitOfElectricPotential.MILLIVOLT,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=_parse_int,
     ),
     AsekoSensorEntityDescription(
         key="cl_free",
@@ -101,7 +77,6 @@ SENSOR_DESCRIPTIONS: tuple[AsekoSensorEntityDescription, ...] = (
         status_key="clFree",
         native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=_parse_float,
     ),
     AsekoSensorEntityDescription(
         key="salinity",
@@ -109,7 +84,6 @@ SENSOR_DESCRIPTIONS: tuple[AsekoSensorEntityDescription, ...] = (
         status_key="salinity",
         native_unit_of_measurement="g/L",
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=_parse_float,
     ),
     AsekoSensorEntityDescription(
         key="electrolyzer",
@@ -117,7 +91,6 @@ SENSOR_DESCRIPTIONS: tuple[AsekoSensorEntityDescription, ...] = (
         status_key="electrolyzer",
         native_unit_of_measurement="%",
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=_parse_int,
     ),
     AsekoSensorEntityDescription(
         key="dose",
@@ -125,7 +98,6 @@ SENSOR_DESCRIPTIONS: tuple[AsekoSensorEntityDescription, ...] = (
         status_key="dose",
         native_unit_of_measurement="%",
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=_parse_int,
     ),
     # Additional numeric sensors
     AsekoSensorEntityDescription(
@@ -134,7 +106,6 @@ SENSOR_DESCRIPTIONS: tuple[AsekoSensorEntityDescription, ...] = (
         status_key="clFreeRequired",
         native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=_parse_float,
     ),
     AsekoSensorEntityDescription(
         key="cl_bounded",
@@ -142,7 +113,6 @@ SENSOR_DESCRIPTIONS: tuple[AsekoSensorEntityDescription, ...] = (
         status_key="clBounded",
         native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=_parse_float,
     ),
     AsekoSensorEntityDescription(
         key="electrode_power",
@@ -150,7 +120,6 @@ SENSOR_DESCRIPTIONS: tuple[AsekoSensorEntityDescription, ...] = (
         status_key="electrodePower",
         native_unit_of_measurement="g/h",
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=_parse_float,
     ),
     AsekoSensorEntityDescription(
         key="filter_flow_speed",
@@ -158,7 +127,6 @@ SENSOR_DESCRIPTIONS: tuple[AsekoSensorEntityDescription, ...] = (
         status_key="filterFlowSpeed",
         native_unit_of_measurement=UnitOfVolumeFlowRate.CUBIC_METERS_PER_HOUR,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=_parse_float,
     ),
     AsekoSensorEntityDescription(
         key="filter_pressure",
@@ -167,7 +135,6 @@ SENSOR_DESCRIPTIONS: tuple[AsekoSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.PRESSURE,
         native_unit_of_measurement=UnitOfPressure.BAR,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=_parse_float,
     ),
     AsekoSensorEntityDescription(
         key="ph_required",
@@ -175,7 +142,6 @@ SENSOR_DESCRIPTIONS: tuple[AsekoSensorEntityDescription, ...] = (
         status_key="phRequired",
         device_class=SensorDeviceClass.PH,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=_parse_float,
     ),
     AsekoSensorEntityDescription(
         key="redox_required",
@@ -184,7 +150,6 @@ SENSOR_DESCRIPTIONS: tuple[AsekoSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.VOLTAGE,
         native_unit_of_measurement=UnitOfElectricPotential.MILLIVOLT,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=_parse_int,
     ),
     AsekoSensorEntityDescription(
         key="solar_temperature",
@@ -193,7 +158,6 @@ SENSOR_DESCRIPTIONS: tuple[AsekoSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=_parse_float,
     ),
     AsekoSensorEntityDescription(
         key="water_level",
@@ -201,7 +165,6 @@ SENSOR_DESCRIPTIONS: tuple[AsekoSensorEntityDescription, ...] = (
         status_key="waterLevel",
         native_unit_of_measurement=UnitOfLength.CENTIMETERS,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=_parse_float,
     ),
     AsekoSensorEntityDescription(
         key="water_temperature_required",
@@ -210,7 +173,6 @@ SENSOR_DESCRIPTIONS: tuple[AsekoSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=_parse_float,
     ),
     # Enum/state sensors (no unit, string values)
     AsekoSensorEntityDescription(
@@ -245,6 +207,12 @@ SENSOR_DESCRIPTIONS: tuple[AsekoSensorEntityDescription, ...] = (
     ),
 )
 
+SENSOR_DESCRIPTIONS_BY_KEY: Mapping[str, AsekoSensorEntityDescription] = (
+    MappingProxyType(
+        {description.status_key: description for description in SENSOR_DESCRIPTIONS}
+    )
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -254,41 +222,77 @@ async def async_setup_entry(
     """Set up Aseko sensors based on a config entry."""
     coordinator: AsekoDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    # Track which units we've already created entities for
-    known_units: set[str] = set()
+    add_new_entities = _AsekoEntityAdder(coordinator, async_add_entities)
+
+    # Add entities for initial data
+    add_new_entities()
+
+    # Register listener for future updates to discover new units
+    entry.async_on_unload(coordinator.async_add_listener(add_new_entities))
+
+
+class _AsekoEntityAdder:
+    """Add sensor entities for newly discovered units."""
+
+    __slots__ = ("coordinator", "async_add_entities", "known_units")
+
+    def __init__(
+        self,
+        coordinator: AsekoDataUpdateCoordinator,
+        async_add_entities: AddEntitiesCallback,
+    ) -> None:
+        """Initialize the entity adder."""
+        self.coordinator = coordinator
+        self.async_add_entities = async_add_entities
+        # Track which units we've already created entities for
+        # (insertion-ordered dict used as a set)
+        self.known_units: dict[str, None] = {}
 
     @callback
-    def _async_add_new_entities() -> None:
+    def __call__(self) -> None:
         """Add entities for newly discovered units."""
+        coordinator = self.coordinator
+        known_units = self.known_units
+        if not coordinator.data.keys() - known_units:
+            return
+
         new_entities: list[AsekoSensorEntity] = []
 
+        # Walk the coordinator data so entities are created in unit order
         for serial_number, unit in coordinator.data.items():
             if serial_number in known_units:
                 continue
 
-            for description in SENSOR_DESCRIPTIONS:
-                if description.status_key in unit.status_values:
+            # Shared by all sensors of the unit
+            device_info = DeviceInfo(
+                identifiers={(DOMAIN, unit.serial_number)},
+                name=unit.name or f"Aseko {unit.serial_number}",
+                manufacturer="Aseko",
+                model=unit.brand_name,
+            )
+
+            for status_key in unit.status_values:
+                description = SENSOR_DESCRIPTIONS_BY_KEY.get(status_key)
+                if description is not None:
                     new_entities.append(
-                        AsekoSensorEntity(coordinator, unit, description)
+                        AsekoSensorEntity(
+                            coordinator, unit, description, device_info
+                        )
                     )
 
-            known_units.add(serial_number)
+            known_units[serial_number] = None
 
         if new_entities:
-            async_add_entities(new_entities)
-
-    # Add entities for initial data
-    _async_add_new_entities()
-
-    # Register listener for future updates to discover new units
-    entry.async_on_unload(
-        coordinator.async_add_listener(_async_add_new_entities)
-    )
+            self.async_add_entities(new_entities)
 
 
 class AsekoSensorEntity(CoordinatorEntity[AsekoDataUpdateCoordinator], SensorEntity):
     """Representation of an Aseko sensor."""
 
+    # Home Assistant entities keep a __dict__, so this only moves our own
+    # per-instance attributes into slots
+    __slots__ = ("_serial_number", "_status_key", "_unit_cache")
+
     entity_description: AsekoSensorEntityDescription
     _attr_has_entity_name = True
 
@@ -297,40 +301,35 @@ class AsekoSensorEntity(CoordinatorEntity[AsekoDataUpdateCoordinator], SensorEnt
         coordinator: AsekoDataUpdateCoordinator,
         unit: AsekoUnit,
         description: AsekoSensorEntityDescription,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.entity_description = description
         self._serial_number = unit.serial_number
+        self._status_key = description.status_key
+        # Unit data for the current refresh, updated in _handle_coordinator_update
+        self._unit_cache: AsekoUnit | None = unit
         self._attr_unique_id = f"{unit.serial_number}_{description.key}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, unit.serial_number)},
-            name=unit.name or f"Aseko {unit.serial_number}",
-            manufacturer="Aseko",
-            model=unit.brand_name,
-        )
+        self._attr_device_info = device_info
 
-    @property
-    def _unit(self) -> AsekoUnit | None:
-        """Return the unit data."""
-        return self.coordinator.data.get(self._serial_number)
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Cache this sensor's unit once per refresh, then write state."""
+        data = self.coordinator.data
+        self._unit_cache = data.get(self._serial_number) if data else None
+        super()._handle_coordinator_update()
 
     @property
     def native_value(self) -> Any:
         """Return the state of the sensor."""
-        if not self._unit:
+        unit = self._unit_cache
+        if unit is None:
             return None
 
-        raw_value = self._unit.status_values.get(self.entity_description.status_key)
-        if raw_value is None:
-            return None
-
-        if self.entity_description.value_fn:
-            return self.entity_description.value_fn(raw_value)
-
-        return raw_value
+        return unit.status_values.get(self._status_key)
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return super().available and self._unit is not None
+        return super().available and self._unit_cache is not None
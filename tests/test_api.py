@@ -1,20 +1,28 @@
 """Tests for the Aseko API client."""
 
+import asyncio
+import json
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
+from aiohttp import ClientConnectionError, ClientSession
+
 from custom_components.aseko.api import (
     AsekoApiClient,
     AsekoApiError,
     AsekoAuthError,
+    AsekoConnectionError,
     AsekoNotFoundError,
+    _parse_float,
+    _parse_int,
 )
 
 
 @pytest.fixture
 def mock_session():
     """Create a mock aiohttp session."""
-    return MagicMock()
+    return AsyncMock(spec=ClientSession)
 
 
 @pytest.fixture
@@ -23,6 +31,189 @@ def api_client(mock_session):
     return AsekoApiClient(mock_session, "test-api-key")
 
 
+def _mock_response(mock_session, payload, status=200, headers=None):
+    """Make the mock session return the given JSON payload."""
+    response = MagicMock(status=status, headers=headers or {})
+    response.read = AsyncMock(return_value=json.dumps(payload).encode())
+    mock_session.request.return_value.__aenter__.return_value = response
+    return response
+
+
+class TestRequestCache:
+    """Tests for the _request response cache."""
+
+    async def test_list_response_is_cached(self, api_client, mock_session):
+        """Test that repeated list requests are served from cache."""
+        _mock_response(mock_session, {"items": [], "totalItems": 0})
+
+        first = await api_client._request("GET", "/paired-units", params={"page": 1})
+        second = await api_client._request("GET", "/paired-units", params={"page": 1})
+
+        assert first == second
+        assert mock_session.request.call_count == 1
+
+    async def test_force_refresh_bypasses_cache(self, api_client, mock_session):
+        """Test that force_refresh always hits the API."""
+        _mock_response(mock_session, {"valid": True})
+
+        await api_client._request("GET", "/auth/check")
+        await api_client._request("GET", "/auth/check", force_refresh=True)
+
+        assert mock_session.request.call_count == 2
+
+    async def test_unit_details_not_cached(self, api_client, mock_session):
+        """Test that unit detail responses are never cached."""
+        _mock_response(mock_session, {"serialNumber": "UNIT1"})
+
+        await api_client._request("GET", "/paired-units/UNIT1")
+        await api_client._request("GET", "/paired-units/UNIT1")
+
+        assert mock_session.request.call_count == 2
+
+
+class TestRequestErrors:
+    """Tests for mapping transport failures to API errors in _request."""
+
+    async def test_timeout_raises_connection_error(self, api_client, mock_session):
+        """Test that a request exceeding the timeout raises a connection error."""
+        response = _mock_response(mock_session, {"serialNumber": "UNIT1"})
+
+        async def _hang():
+            await asyncio.sleep(1)
+            return response
+
+        mock_session.request.return_value.__aenter__.side_effect = _hang
+
+        with (
+            patch("custom_components.aseko.api.DEFAULT_HTTP_TIMEOUT", 0.01),
+            pytest.raises(AsekoConnectionError, match="timed out"),
+        ):
+            await api_client._request("GET", "/paired-units/UNIT1")
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            pytest.param(ClientConnectionError("Connection refused"), id="client_error"),
+            pytest.param(OSError("Network unreachable"), id="os_error"),
+        ],
+    )
+    async def test_transport_error_raises_connection_error(
+        self, api_client, mock_session, error
+    ):
+        """Test that transport failures raise a connection error."""
+        mock_session.request.return_value.__aenter__.side_effect = error
+
+        with pytest.raises(AsekoConnectionError, match="Connection error"):
+            await api_client._request("GET", "/paired-units/UNIT1")
+
+    async def test_invalid_json_raises_api_error(self, api_client, mock_session):
+        """Test that an unparsable body raises an API error."""
+        response = _mock_response(mock_session, None)
+        response.read.return_value = b"not json"
+
+        with pytest.raises(AsekoApiError, match="Invalid JSON response"):
+            await api_client._request("GET", "/paired-units/UNIT1")
+
+    async def test_cancellation_propagates(self, api_client, mock_session):
+        """Test that cancellation is not turned into an API error."""
+        mock_session.request.return_value.__aenter__.side_effect = (
+            asyncio.CancelledError()
+        )
+
+        with pytest.raises(asyncio.CancelledError):
+            await api_client._request("GET", "/paired-units/UNIT1")
+
+
+class TestSingleFlight:
+    """Tests for coalescing concurrent identical requests."""
+
+    async def test_concurrent_gets_share_one_request(self, api_client, mock_session):
+        """Test that concurrent identical GETs hit the API once."""
+        _mock_response(mock_session, {"serialNumber": "UNIT1"})
+
+        first, second = await asyncio.gather(
+            api_client._request("GET", "/paired-units/UNIT1"),
+            api_client._request("GET", "/paired-units/UNIT1"),
+        )
+
+        assert first == second == {"serialNumber": "UNIT1"}
+        assert mock_session.request.call_count == 1
+        assert not api_client._inflight
+
+    async def test_cancelling_sole_caller_cancels_request(
+        self, api_client, mock_session
+    ):
+        """Test that the request is cancelled once nobody awaits it."""
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def _hang():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        mock_session.request.return_value.__aenter__.side_effect = _hang
+
+        caller = asyncio.ensure_future(
+            api_client._request("GET", "/paired-units/UNIT1")
+        )
+        await started.wait()
+        caller.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        await asyncio.wait_for(cancelled.wait(), 1)
+        assert not api_client._inflight_waiters
+
+    async def test_cancelling_one_caller_keeps_request(
+        self, api_client, mock_session
+    ):
+        """Test that the remaining caller still gets the shared response."""
+        response = _mock_response(mock_session, {"serialNumber": "UNIT1"})
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def _slow():
+            started.set()
+            await release.wait()
+            return response
+
+        mock_session.request.return_value.__aenter__.side_effect = _slow
+
+        first = asyncio.ensure_future(api_client._request("GET", "/paired-units/UNIT1"))
+        second = asyncio.ensure_future(api_client._request("GET", "/paired-units/UNIT1"))
+        await started.wait()
+        first.cancel()
+        release.set()
+
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert await second == {"serialNumber": "UNIT1"}
+        assert mock_session.request.call_count == 1
+        assert not api_client._inflight_waiters
+
+
+class TestConditionalRequests:
+    """Tests for ETag/Last-Modified handling in _request."""
+
+    async def test_not_modified_returns_previous_body(self, api_client, mock_session):
+        """Test that a 304 response reuses the previously parsed body."""
+        payload = {"serialNumber": "UNIT1"}
+        _mock_response(mock_session, payload, headers={"ETag": '"abc"'})
+        await api_client._request("GET", "/paired-units/UNIT1")
+
+        response = _mock_response(mock_session, None, status=304)
+        data = await api_client._request("GET", "/paired-units/UNIT1")
+
+        assert data == payload
+        response.read.assert_not_called()
+        sent_headers = mock_session.request.call_args.kwargs["headers"]
+        assert sent_headers["If-None-Match"] == '"abc"'
+
+
 class TestGetUnitSerials:
     """Tests for get_unit_serials method."""
 
@@ -40,64 +231,294 @@ class TestGetUnitSerials:
 
             serials = await api_client.get_unit_serials()
 
-            assert serials == ["AAA456", "MMM789", "ZZZ123"]
+            assert serials == ("AAA456", "MMM789", "ZZZ123")
+
+    async def test_fetches_all_pages(self, api_client):
+        """Test that every page after the first is requested."""
+
+        async def _page(method, endpoint, params, **kwargs):
+            page = params["page"]
+            items = [] if page > 3 else [{"serialNumber": f"UNIT{page}"}]
+            return {"items": items, "totalItems": 250}
+
+        with patch.object(api_client, "_request", side_effect=_page) as mock_request:
+            serials = await api_client.get_unit_serials()
+
+            assert serials == ("UNIT1", "UNIT2", "UNIT3")
+            assert mock_request.call_count == 3
+
+    async def test_reuses_recent_listing(self, api_client, mock_session):
+        """Test that a second call within the TTL does not hit the API."""
+        _mock_response(
+            mock_session, {"items": [{"serialNumber": "UNIT1"}], "totalItems": 1}
+        )
+
+        first = await api_client.get_unit_serials()
+        second = await api_client.get_unit_serials()
+
+        assert first == second == ("UNIT1",)
+        assert mock_session.request.call_count == 1
 
 
 class TestGetUnits:
     """Tests for get_units method."""
 
-    async def test_auth_error_bubbles_up(self, api_client):
-        """Test that AsekoAuthError from parallel fetches is raised."""
-        with patch.object(api_client, "get_unit_serials") as mock_serials:
-            mock_serials.return_value = ["UNIT1", "UNIT2"]
+    @pytest.fixture(autouse=True)
+    def _per_unit_path(self, api_client):
+        """Force the per-unit fetch path."""
+        api_client._supports_bulk_expand = False
 
-            with patch.object(api_client, "get_unit") as mock_get_unit:
+    @pytest.mark.parametrize(
+        ("serials", "side_effect", "expected"),
+        [
+            pytest.param(
+                ["UNIT1", "UNIT2"],
                 # First unit succeeds, second returns auth error
-                mock_get_unit.side_effect = [
-                    MagicMock(serial_number="UNIT1"),
-                    AsekoAuthError("Token expired"),
+                [SimpleNamespace(serial_number="UNIT1"), AsekoAuthError("Token expired")],
+                pytest.raises(AsekoAuthError, match="Token expired"),
+                id="auth_error_bubbles_up",
+            ),
+            pytest.param(
+                ["UNIT1", "UNIT2", "UNIT3"],
+                AsekoNotFoundError("Not found"),
+                pytest.raises(AsekoApiError, match="All 3 units returned 404"),
+                id="all_404_raises_error",
+            ),
+            pytest.param(
+                ["UNIT1", "UNIT2", "UNIT3"],
+                [
+                    SimpleNamespace(serial_number="UNIT1"),
+                    AsekoNotFoundError("Not found"),
+                    SimpleNamespace(serial_number="UNIT3"),
+                ],
+                ["UNIT1", "UNIT3"],
+                id="partial_success_returns_available_units",
+            ),
+            pytest.param([], None, [], id="empty_serials_returns_empty_list"),
+        ],
+    )
+    async def test_get_units(self, api_client, serials, side_effect, expected):
+        """Test get_units result for per-unit fetch outcomes."""
+        with (
+            patch.object(api_client, "get_unit_serials", return_value=serials),
+            patch.object(api_client, "get_unit", side_effect=side_effect),
+        ):
+            if isinstance(expected, list):
+                units = await api_client.get_units()
+                assert [unit.serial_number for unit in units] == expected
+            else:
+                with expected:
+                    await api_client.get_units()
+
+    async def test_offline_unit_details_fetched_once(self, api_client):
+        """Test that a unit offline at startup keeps its values and warning."""
+        listing = {
+            "items": [
+                {"serialNumber": "UNIT1", "online": True},
+                {"serialNumber": "UNIT2", "online": False},
+            ],
+            "totalItems": 2,
+        }
+        details = {
+            "UNIT1": {"serialNumber": "UNIT1", "online": True},
+            "UNIT2": {
+                "serialNumber": "UNIT2",
+                "online": False,
+                "statusValues": {"ph": "7.2"},
+                "statusMessages": [{"type": "UNIT_OFFLINE", "severity": "ERROR"}],
+            },
+        }
+
+        async def _respond(method, endpoint, **kwargs):
+            if endpoint == "/paired-units":
+                return listing
+            return details[endpoint.rsplit("/", 1)[1]]
+
+        with patch.object(api_client, "_request", side_effect=_respond):
+            with patch.object(
+                api_client, "get_unit", wraps=api_client.get_unit
+            ) as mock_get_unit:
+                first = await api_client.get_units()
+                second = await api_client.get_units()
+
+                assert [call.args for call in mock_get_unit.call_args_list] == [
+                    ("UNIT1",),
+                    ("UNIT2",),
+                    ("UNIT1",),
                 ]
 
-                with pytest.raises(AsekoAuthError, match="Token expired"):
-                    await api_client.get_units()
+            listing["items"][1]["online"] = True
+            with patch.object(
+                api_client, "get_unit", wraps=api_client.get_unit
+            ) as mock_get_unit:
+                await api_client.get_units()
 
-    async def test_all_404_raises_error(self, api_client):
-        """Test that all units returning 404 raises an error."""
-        with patch.object(api_client, "get_unit_serials") as mock_serials:
-            mock_serials.return_value = ["UNIT1", "UNIT2", "UNIT3"]
+                assert mock_get_unit.call_count == 2
 
-            with patch.object(api_client, "get_unit") as mock_get_unit:
-                mock_get_unit.side_effect = AsekoNotFoundError("Not found")
+        assert first[1] == second[1]
+        assert first[1].status_values == {"ph": 7.2}
+        assert first[1].has_warning is True
+        assert first[1].online is False
 
-                with pytest.raises(AsekoApiError, match="All 3 units returned 404"):
-                    await api_client.get_units()
 
-    async def test_partial_success_returns_available_units(self, api_client):
-        """Test that partial failures still return successful units."""
-        with patch.object(api_client, "get_unit_serials") as mock_serials:
-            mock_serials.return_value = ["UNIT1", "UNIT2", "UNIT3"]
+class TestGetUnitsExpanded:
+    """Tests for the bulk expand path of get_units."""
 
-            unit1 = MagicMock(serial_number="UNIT1")
-            unit3 = MagicMock(serial_number="UNIT3")
+    async def test_expanded_items_skip_per_unit_fetch(self, api_client):
+        """Test that inlined details are parsed without per-unit requests."""
+        with patch.object(api_client, "_request") as mock_request:
+            mock_request.return_value = {
+                "items": [
+                    {
+                        "serialNumber": "UNIT1",
+                        "online": True,
+                        "statusValues": {"ph": "7.2"},
+                        "statusMessages": [],
+                    },
+                ],
+                "totalItems": 1,
+            }
 
             with patch.object(api_client, "get_unit") as mock_get_unit:
-                mock_get_unit.side_effect = [
-                    unit1,
-                    AsekoNotFoundError("Not found"),
-                    unit3,
-                ]
-
                 units = await api_client.get_units()
 
-                assert len(units) == 2
-                assert units[0].serial_number == "UNIT1"
-                assert units[1].serial_number == "UNIT3"
+                mock_get_unit.assert_not_called()
+
+            assert [unit.serial_number for unit in units] == ["UNIT1"]
+            assert units[0].status_values == {"ph": 7.2}
+            assert api_client._supports_bulk_expand is True
+
+    async def test_not_found_falls_back_to_per_unit_fetch(self, api_client):
+        """Test that a 404 on the expand probe disables it."""
+        unit1 = SimpleNamespace(serial_number="UNIT1")
 
-    async def test_empty_serials_returns_empty_list(self, api_client):
-        """Test that no serials returns empty list without error."""
-        with patch.object(api_client, "get_unit_serials") as mock_serials:
-            mock_serials.return_value = []
+        with patch.object(api_client, "_request") as mock_request:
+            mock_request.side_effect = AsekoNotFoundError("Not found", status=404)
+
+            with patch.object(api_client, "get_unit_serials") as mock_serials:
+                mock_serials.return_value = ["UNIT1"]
+
+                with patch.object(api_client, "get_unit") as mock_get_unit:
+                    mock_get_unit.return_value = unit1
+
+                    units = await api_client.get_units()
+
+        assert units == [unit1]
+        assert api_client._supports_bulk_expand is False
+
+    async def test_bad_request_falls_back_to_per_unit_fetch(self, api_client):
+        """Test that a 400 on the expand probe disables it."""
+        unit1 = SimpleNamespace(serial_number="UNIT1")
+
+        with patch.object(api_client, "_request") as mock_request:
+            mock_request.side_effect = AsekoApiError(
+                "API request failed: 400", status=400
+            )
+
+            with patch.object(api_client, "get_unit_serials") as mock_serials:
+                mock_serials.return_value = ["UNIT1"]
+
+                with patch.object(api_client, "get_unit") as mock_get_unit:
+                    mock_get_unit.return_value = unit1
+
+                    units = await api_client.get_units()
+
+        assert units == [unit1]
+        assert api_client._supports_bulk_expand is False
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            pytest.param(
+                AsekoApiError("API request failed: 503", status=503),
+                id="server_error",
+            ),
+            pytest.param(
+                AsekoApiError("API request failed: 429", status=429),
+                id="rate_limited",
+            ),
+            pytest.param(AsekoApiError("Invalid JSON response"), id="invalid_json"),
+            pytest.param(AsekoConnectionError("Connection error"), id="connection"),
+        ],
+    )
+    async def test_transient_error_probes_again(self, api_client, error):
+        """Test that a transient probe failure falls back for one refresh only."""
+        unit1 = SimpleNamespace(serial_number="UNIT1")
 
-            units = await api_client.get_units()
+        with (
+            patch.object(api_client, "_request", side_effect=error) as mock_request,
+            patch.object(api_client, "get_unit_serials", return_value=["UNIT1"]),
+            patch.object(api_client, "get_unit", return_value=unit1),
+        ):
+            first = await api_client.get_units()
+            second = await api_client.get_units()
 
-            assert units == []
+            assert mock_request.call_count == 2
+
+        assert first == second == [unit1]
+        assert api_client._supports_bulk_expand is None
+
+
+class TestParseUnit:
+    """Tests for _parse_unit method."""
+
+    def test_parses_boolean_status_values(self, api_client):
+        """Test that boolean status values are parsed once at parse time."""
+        unit = api_client._parse_unit(
+            {
+                "serialNumber": "UNIT1",
+                "statusValues": {
+                    "filtrationRunning": "yes",
+                    "heatingRunning": "OFF",
+                    "solarRunning": "---",
+                    "ph": "7.2",
+                },
+            }
+        )
+
+        assert unit.parsed_bools == {
+            "filtrationRunning": True,
+            "heatingRunning": False,
+            "solarRunning": None,
+        }
+
+    def test_parses_numeric_status_values(self, api_client):
+        """Test that sensor values are parsed once at parse time."""
+        unit = api_client._parse_unit(
+            {
+                "serialNumber": "UNIT1",
+                "statusValues": {
+                    "waterTemperature": "27.5",
+                    "redox": "650",
+                    "clFree": "---",
+                    "mode": "AUTO",
+                },
+            }
+        )
+
+        assert unit.status_values == {
+            "waterTemperature": 27.5,
+            "redox": 650,
+            "clFree": None,
+            "mode": "AUTO",
+        }
+
+
+@pytest.mark.parametrize(
+    ("value", "expected_float", "expected_int"),
+    [
+        ("27.5", 27.5, 27),
+        ("650", 650.0, 650),
+        (7.2, 7.2, 7),
+        ("---", None, None),
+        ("", None, None),
+        (None, None, None),
+        ("n/a", None, None),
+        (["7.2"], None, None),
+        ({"value": "7.2"}, None, None),
+    ],
+)
+def test_parse_numeric_values(value, expected_float, expected_int):
+    """Test numeric status value parsing and sentinel handling."""
+    assert _parse_float(value) == expected_float
+    assert _parse_int(value) == expected_int
@@ -0,0 +1,114 @@
+"""Tests for the Aseko data update coordinator."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.aseko.api import AsekoUnit
+from custom_components.aseko.const import (
+    DEFAULT_SCAN_INTERVAL,
+    MAX_SCAN_INTERVAL,
+    UNCHANGED_CYCLES_BEFORE_BACKOFF,
+)
+from custom_components.aseko.coordinator import AsekoDataUpdateCoordinator
+
+
+@pytest.fixture
+def coordinator():
+    """Create a coordinator with stub Home Assistant, client and entry."""
+    return AsekoDataUpdateCoordinator(MagicMock(), MagicMock(), MagicMock())
+
+
+def _unit(ph=7.2, has_warning=False, filtration=True):
+    """Build a unit with the given reading, warning state and equipment state."""
+    return AsekoUnit(
+        serial_number="UNIT1",
+        name=None,
+        note=None,
+        online=True,
+        has_warning=has_warning,
+        brand_name=None,
+        status_values={"ph": ph},
+        status_messages=(
+            [{"type": "WATER_LEVEL_TOO_LOW", "severity": "WARNING"}]
+            if has_warning
+            else []
+        ),
+        parsed_bools={"filtrationRunning": filtration},
+    )
+
+
+def _interval(coordinator):
+    """Return the coordinator's update interval in seconds."""
+    return coordinator.update_interval.total_seconds()
+
+
+class TestAdjustUpdateInterval:
+    """Tests for _adjust_update_interval."""
+
+    def test_backs_off_while_state_unchanged(self, coordinator):
+        """Test that the interval doubles once state stays the same long enough."""
+        coordinator._adjust_update_interval([_unit()])
+        for _ in range(UNCHANGED_CYCLES_BEFORE_BACKOFF - 1):
+            coordinator._adjust_update_interval([_unit()])
+            assert _interval(coordinator) == DEFAULT_SCAN_INTERVAL
+
+        coordinator._adjust_update_interval([_unit()])
+
+        assert _interval(coordinator) == DEFAULT_SCAN_INTERVAL * 2
+
+    def test_reading_jitter_does_not_count_as_change(self, coordinator):
+        """Test that readings moving within the tolerance allow backing off."""
+        for step in range(UNCHANGED_CYCLES_BEFORE_BACKOFF + 1):
+            coordinator._adjust_update_interval([_unit(ph=7.2 + step % 2 / 100)])
+
+        assert _interval(coordinator) == DEFAULT_SCAN_INTERVAL * 2
+
+    def test_reading_change_resets_to_default(self, coordinator):
+        """Test that a reading moving beyond the tolerance resets the interval."""
+        for _ in range(50):
+            coordinator._adjust_update_interval([_unit()])
+
+        coordinator._adjust_update_interval([_unit(ph=6.8)])
+
+        assert _interval(coordinator) == DEFAULT_SCAN_INTERVAL
+
+    def test_slow_drift_counts_as_change(self, coordinator):
+        """Test that small steps add up against the last change."""
+        for _ in range(50):
+            coordinator._adjust_update_interval([_unit()])
+
+        for step in range(1, 4):
+            coordinator._adjust_update_interval([_unit(ph=7.2 + step * 0.05)])
+
+        assert _interval(coordinator) == DEFAULT_SCAN_INTERVAL
+
+    def test_backoff_is_capped(self, coordinator):
+        """Test that the interval never exceeds MAX_SCAN_INTERVAL."""
+        for _ in range(50):
+            coordinator._adjust_update_interval([_unit()])
+
+        assert _interval(coordinator) == MAX_SCAN_INTERVAL
+
+    @pytest.mark.parametrize(
+        "changed_unit",
+        [
+            pytest.param(_unit(filtration=False), id="equipment_changed"),
+            pytest.param(_unit(has_warning=True), id="warning_raised"),
+        ],
+    )
+    def test_change_resets_to_default(self, coordinator, changed_unit):
+        """Test that a state change returns to the default interval, not below."""
+        for _ in range(50):
+            coordinator._adjust_update_interval([_unit()])
+
+        coordinator._adjust_update_interval([changed_unit])
+
+        assert _interval(coordinator) == DEFAULT_SCAN_INTERVAL
+
+    def test_persistent_warning_holds_default(self, coordinator):
+        """Test that an active warning keeps the default interval."""
+        for _ in range(50):
+            coordinator._adjust_update_interval([_unit(has_warning=True)])
+
+        assert _interval(coordinator) == DEFAULT_SCAN_INTERVAL
@@ -0,0 +1,19 @@
+"""Tests for the Aseko sensor platform."""
+
+import pytest
+
+from custom_components.aseko.api import _VALUE_PARSERS
+from custom_components.aseko.sensor import SENSOR_DESCRIPTIONS
+
+
+@pytest.mark.parametrize(
+    "description",
+    [
+        pytest.param(description, id=description.key)
+        for description in SENSOR_DESCRIPTIONS
+        if description.state_class is not None
+    ],
+)
+def test_measurement_sensors_have_numeric_parser(description):
+    """Test that every sensor with a state class gets a parsed numeric value."""
+    assert description.status_key in _VALUE_PARSERS